@@ -104,8 +104,9 @@ def fp_eval_maml(i, val, supervised, z_star, neural_net_fwd, neural_net_grad, th
     # return z_next, loss_vec, z_all, obj_diffs
 
 
-def k_steps_train_glista(k, z0, q, params, W, D, supervised, z_star, jit):
+def k_steps_train_glista(k, z0, q, params, W, D, supervised, z_star, jit, WtD=None):
     iter_losses = jnp.zeros(k)
+    Wtb = None if WtD is None else W.T @ q
 
     fp_train_partial = partial(fp_train_glista,
                                supervised=supervised,
@@ -113,7 +114,9 @@ def k_steps_train_glista(k, z0, q, params, W, D, supervised, z_star, jit):
                                W=W,
                                D=D,
                                b=q,
-                               params=params
+                               params=params,
+                               WtD=WtD,
+                               Wtb=Wtb
                                )
     val = z0, iter_losses
     start_iter = 0
@@ -125,8 +128,9 @@ def k_steps_train_glista(k, z0, q, params, W, D, supervised, z_star, jit):
     return z_final, iter_losses
 
 
-def k_steps_eval_glista(k, z0, q, params, W, D, supervised, z_star, jit):
+def k_steps_eval_glista(k, z0, q, params, W, D, supervised, z_star, jit, WtD=None):
     iter_losses, obj_diffs = jnp.zeros(k), jnp.zeros(k)
+    Wtb = None if WtD is None else W.T @ q
     z_all_plus_1 = jnp.zeros((k + 1, z0.size))
     z_all_plus_1 = z_all_plus_1.at[0, :].set(z0)
     fp_eval_partial = partial(fp_eval_glista,
@@ -135,7 +139,9 @@ def k_steps_eval_glista(k, z0, q, params, W, D, supervised, z_star, jit):
                                W=W,
                                D=D,
                                b=q,
-                               params=params
+                               params=params,
+                               WtD=WtD,
+                               Wtb=Wtb
                               )
     z_all = jnp.zeros((k, z0.size))
     val = z0, iter_losses, z_all, obj_diffs
@@ -149,7 +155,7 @@ def k_steps_eval_glista(k, z0, q, params, W, D, supervised, z_star, jit):
     return z_final, iter_losses, z_all_plus_1, obj_diffs
 
 
-def fixed_point_glista(z, W, D, b, gamma, theta, mu, nu, a):
+def fixed_point_glista(z, W, D, b, gamma, theta, mu, nu, a, WtD=None, Wtb=None):
     """
     applies the ista fixed point operator
     """
@@ -158,7 +164,7 @@ def fixed_point_glista(z, W, D, b, gamma, theta, mu, nu, a):
     # gain
     gain = gain_gate(z, theta, mu, nu)
     z_gain = jnp.multiply(gain, z)
-    z_tilde = fixed_point_alista(z_gain, W, D, b, gamma, theta)
+    z_tilde = fixed_point_alista(z_gain, W, D, b, gamma, theta, WtD, Wtb)
 
     # overshoot
     overshoot = overshoot_gate(z, z_tilde, a)
@@ -177,27 +183,27 @@ def gain_gate(z, theta, mu, nu):
     return 1 + mu * theta * f
 
 
-def fp_train_glista(i, val, supervised, z_star, params, W, D, b):
+def fp_train_glista(i, val, supervised, z_star, params, W, D, b, WtD=None, Wtb=None):
     z, loss_vec = val
     gamma = params[i, 0] #jnp.exp(params[i, 0])
     theta = params[i, 1] #jnp.exp(params[i, 1])
     mu = params[i, 2]
     nu = params[i, 3]
     a = params[i, 4]
-    z_next = fixed_point_glista(z, W, D, b, gamma, theta, mu, nu, a)
+    z_next = fixed_point_glista(z, W, D, b, gamma, theta, mu, nu, a, WtD, Wtb)
     diff = jnp.linalg.norm(z - z_star) ** 2
     loss_vec = loss_vec.at[i].set(diff)
     return z_next, loss_vec
 
 
-def fp_eval_glista(i, val, supervised, z_star, params, W, D, b):
+def fp_eval_glista(i, val, supervised, z_star, params, W, D, b, WtD=None, Wtb=None):
     z, loss_vec, z_all, obj_diffs = val
     gamma = params[i, 0]
     theta = params[i, 1]
     mu = params[i, 2]
     nu = params[i, 3]
     a = params[i, 4]
-    z_next = fixed_point_glista(z, W, D, b, gamma, theta, mu, nu, a)
+    z_next = fixed_point_glista(z, W, D, b, gamma, theta, mu, nu, a, WtD, Wtb)
     diff = 10 * jnp.log10(jnp.linalg.norm(z - z_star) ** 2 / jnp.linalg.norm(z_star) ** 2)
     loss_vec = loss_vec.at[i].set(diff)
     obj = .5 * jnp.linalg.norm(D @ z_next - b) ** 2 # + lambd * jnp.linalg.norm(z_next, ord=1)
@@ -468,8 +474,9 @@ def fp_eval_tilista(i, val, supervised, z_star, params, D, b):
     return z_next, loss_vec, z_all, obj_diffs
 
 
-def k_steps_train_alista(k, z0, q, params, W, D, supervised, z_star, jit):
+def k_steps_train_alista(k, z0, q, params, W, D, supervised, z_star, jit, WtD=None):
     iter_losses = jnp.zeros(k)
+    Wtb = None if WtD is None else W.T @ q
 
     fp_train_partial = partial(fp_train_alista,
                                supervised=supervised,
@@ -477,7 +484,9 @@ def k_steps_train_alista(k, z0, q, params, W, D, supervised, z_star, jit):
                                W=W,
                                D=D,
                                b=q,
-                               params=params
+                               params=params,
+                               WtD=WtD,
+                               Wtb=Wtb
                                )
     val = z0, iter_losses
     start_iter = 0
@@ -489,8 +498,9 @@ def k_steps_train_alista(k, z0, q, params, W, D, supervised, z_star, jit):
     return z_final, iter_losses
 
 
-def k_steps_eval_alista(k, z0, q, params, W, D, supervised, z_star, jit):
+def k_steps_eval_alista(k, z0, q, params, W, D, supervised, z_star, jit, WtD=None):
     iter_losses, obj_diffs = jnp.zeros(k), jnp.zeros(k)
+    Wtb = None if WtD is None else W.T @ q
     z_all_plus_1 = jnp.zeros((k + 1, z0.size))
     z_all_plus_1 = z_all_plus_1.at[0, :].set(z0)
     fp_eval_partial = partial(fp_eval_alista,
@@ -499,7 +509,9 @@ def k_steps_eval_alista(k, z0, q, params, W, D, supervised, z_star, jit):
                                W=W,
                                D=D,
                                b=q,
-                               params=params
+                               params=params,
+                               WtD=WtD,
+                               Wtb=Wtb
                               )
     z_all = jnp.zeros((k, z0.size))
     val = z0, iter_losses, z_all, obj_diffs
@@ -513,28 +525,32 @@ def k_steps_eval_alista(k, z0, q, params, W, D, supervised, z_star, jit):
     return z_final, iter_losses, z_all_plus_1, obj_diffs
 
 
-def fixed_point_alista(z, W, D, b, gamma, theta):
+def fixed_point_alista(z, W, D, b, gamma, theta, WtD=None, Wtb=None):
     """
     applies the ista fixed point operator
+
+    if WtD = W.T @ D and Wtb = W.T @ b are given, they are used in place of the two matvecs
     """
-    return soft_threshold(z - gamma * W.T.dot(D.dot(z) - b), theta)
+    if WtD is None:
+        return soft_threshold(z - gamma * W.T.dot(D.dot(z) - b), theta)
+    return soft_threshold(z - gamma * (WtD.dot(z) - Wtb), theta)
 
 
-def fp_train_alista(i, val, supervised, z_star, params, W, D, b):
+def fp_train_alista(i, val, supervised, z_star, params, W, D, b, WtD=None, Wtb=None):
     z, loss_vec = val
     gamma = params[i, 0] #jnp.exp(params[i, 0])
     theta = params[i, 1] #jnp.exp(params[i, 1])
-    z_next = fixed_point_alista(z, W, D, b, gamma, theta)
+    z_next = fixed_point_alista(z, W, D, b, gamma, theta, WtD, Wtb)
     diff = jnp.linalg.norm(z - z_star) ** 2
     loss_vec = loss_vec.at[i].set(diff)
     return z_next, loss_vec
 
 
-def fp_eval_alista(i, val, supervised, z_star, params, W, D, b):
+def fp_eval_alista(i, val, supervised, z_star, params, W, D, b, WtD=None, Wtb=None):
     z, loss_vec, z_all, obj_diffs = val
     gamma = params[i, 0]
     theta = params[i, 1]
-    z_next = fixed_point_alista(z, W, D, b, gamma, theta)
+    z_next = fixed_point_alista(z, W, D, b, gamma, theta, WtD, Wtb)
     diff = 10 * jnp.log10(jnp.linalg.norm(z - z_star) ** 2 / jnp.linalg.norm(z_star) ** 2)
     loss_vec = loss_vec.at[i].set(diff)
     obj = .5 * jnp.linalg.norm(D @ z_next - b) ** 2 # + lambd * jnp.linalg.norm(z_next, ord=1)
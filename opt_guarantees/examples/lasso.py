@@ -32,7 +32,7 @@ def run(run_cfg):
     # A = jnp.diag(A_vec)
     # density = 0.1
     # A = A_scale * jnp.array(random(m_orig, n_orig, density=density, format='csr').todense())
-    evals, evecs = jnp.linalg.eigh(A.T @ A)
+    evals = jnp.linalg.eigvalsh(A.T @ A)
     ista_step =  1 / evals.max()
     lambd = setup_cfg['lambd']
 
@@ -63,7 +63,7 @@ def setup_probs(setup_cfg):
     # A = jnp.diag(A_vec)
     # density = 0.1
     # A = A_scale * jnp.array(random(m_orig, n_orig, density=density, format='csr').todense())
-    evals, evecs = jnp.linalg.eigh(A.T @ A)
+    evals = jnp.linalg.eigvalsh(A.T @ A)
     ista_step = 1 / evals.max()
     lambd = setup_cfg['lambd']
 
@@ -37,7 +37,7 @@ def run(run_cfg):
     
 
     # get the ista values
-    evals, evecs = jnp.linalg.eigh(D.T @ D)
+    evals = jnp.linalg.eigvalsh(D.T @ D)
     step = 1 / evals.max()
     lambd = .1
     eta = lambd * step
@@ -417,7 +417,7 @@ class L2Omodel(object):
             if self.deterministic:
                 nn_output = predict_y(mean_params, input)
             else:
-                perturb = get_perturbed_weights(random.PRNGKey(key), self.layer_sizes, 1)
+                perturb = get_perturbed_weights(key, self.layer_sizes, 1)
                 perturbed_weights = [(perturb[i][0] * jnp.sqrt(jnp.exp(sigma_params[i][0])) +
                                        mean_params[i][0], 
                                     perturb[i][1] * jnp.sqrt(jnp.exp(sigma_params[i][1])) + 
@@ -490,7 +490,8 @@ class L2Omodel(object):
         out_axes = self.get_out_axes_shape(diff_required)
 
         # just for reference, the arguments for predict are
-        #   predict(params, input, q, iters, z_star, factor)
+        #   predict(params, input, q, iters, z_star, key, factor)
+        #   where key is a PRNG key (loss_fn takes an integer seed)
 
         if self.factors_required and not self.factor_static_bool:
             # for the case where the factors change for each problem
@@ -500,6 +501,8 @@ class L2Omodel(object):
 
             @partial(jit, static_argnums=(3,))
             def loss_fn(params, inputs, b, iters, z_stars, key, factors):
+                # build the PRNG key from the integer seed once, outside of predict
+                key = random.PRNGKey(key)
                 if diff_required:
                     losses = batch_predict(params, inputs, b, iters, z_stars, key, factors)
                     return losses.mean()
@@ -523,6 +526,8 @@ class L2Omodel(object):
 
             @partial(jit, static_argnums=(3,))
             def loss_fn(params, inputs, b, iters, z_stars, key):
+                # build the PRNG key from the integer seed once, outside of predict
+                key = random.PRNGKey(key)
                 if diff_required:
                     losses = batch_predict(params, inputs, b, iters, z_stars, key)
                     q = losses.mean() / self.penalty_coeff
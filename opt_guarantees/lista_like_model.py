@@ -0,0 +1,171 @@
+from functools import partial
+
+import jax.numpy as jnp
+import numpy as np
+from jax import jit, random, vmap
+
+from opt_guarantees.algo_steps import k_steps_eval_ista
+from opt_guarantees.l2o_model import L2Omodel
+from opt_guarantees.utils.nn_utils import calculate_pinsker_penalty, compute_single_param_KL
+
+
+class LISTALikemodel(L2Omodel):
+    """
+    shared model for the unrolled LISTA-type algorithms (ALISTA, GLISTA) that learn
+    n_params_per_step scalar parameters for each of the train_unrolls steps
+
+    subclasses set self.algo and self.n_params_per_step and call initialize_lista_like
+    with their train and eval k_steps functions from initialize_algo
+    """
+    def __init__(self, **kwargs):
+        super(LISTALikemodel, self).__init__(**kwargs)
+
+    def initialize_lista_like(self, input_dict, k_steps_train, k_steps_eval):
+        self.factor_static = None
+        self.factors_required = False
+        self.q_mat_train, self.q_mat_test = input_dict['b_mat_train'], input_dict['b_mat_test']
+        D, W = input_dict['D'], input_dict['W']
+        # lambd = input_dict['lambd']
+        # ista_step = input_dict['ista_step']
+        self.D, self.W = D, W
+        self.m, self.n = D.shape
+        self.output_size = self.n
+
+        # largest eigenvalue of D.T @ D is the squared spectral norm of D
+        # computed once with numpy on the host: no device transfer or XLA compile needed
+        lam_max = np.linalg.norm(np.asarray(D), ord=2) ** 2
+        # step = 1 / lam_max
+        lambd = 0.1
+        # keep the step as a python float so it is a compile-time constant when jitted
+        self.ista_step = float(lambd / lam_max)
+
+        self.k_steps_train_fn, self.k_steps_eval_fn = self.create_k_steps_fns(
+            k_steps_train, k_steps_eval, D, W)
+        # plain ista used for the fixed warm-start (bypass_nn) evaluation
+        self.ista_eval_fn = partial(k_steps_eval_ista, lambd=lambd, A=D,
+                                    ista_step=self.ista_step, supervised=True, jit=True)
+        self.out_axes_length = 5
+
+    def create_k_steps_fns(self, k_steps_train, k_steps_eval, D, W):
+        """
+        binds D and W into jitted train and eval fns so that they are captured as constants
+        instead of being passed (and hashed) as arguments on every call
+        """
+        D, W = jnp.asarray(D), jnp.asarray(W)
+        loop_jit = self.jit
+
+        # W.T @ D (n x n) replaces the two matvecs with D and W.T (m x n each) in every step,
+        # so only precompute it when it does not increase the per-step cost
+        m, n = D.shape
+        self.WtD = W.T @ D if n <= 2 * m else None
+        WtD = self.WtD
+
+        @partial(jit, static_argnames=('k', 'supervised'))
+        def k_steps_train_fn(k, z0, q, params, supervised, z_star):
+            return k_steps_train(k=k, z0=z0, q=q, params=params, W=W, D=D,
+                                 supervised=supervised, z_star=z_star, jit=loop_jit, WtD=WtD)
+
+        @partial(jit, static_argnames=('k', 'supervised'))
+        def k_steps_eval_fn(k, z0, q, params, supervised, z_star):
+            return k_steps_eval(k=k, z0=z0, q=q, params=params, W=W, D=D,
+                                supervised=supervised, z_star=z_star, jit=loop_jit, WtD=WtD)
+        return k_steps_train_fn, k_steps_eval_fn
+
+    def init_mean_params(self):
+        return jnp.ones((self.train_unrolls, self.n_params_per_step))
+
+    def init_params(self):
+        self.mean_params = self.init_mean_params()
+
+        # # initialize with ista values
+        # # alista_step = alista_cfg['step']
+        # # alista_eta = alista_cfg['eta']
+        # # self.mean_params = self.mean_params.at[:, 0].set(alista_step)
+        # # self.mean_params = self.mean_params.at[:, 1].set(alista_eta)
+
+        self.sigma_params = -jnp.ones((self.train_unrolls, self.n_params_per_step)) * 10
+
+        # initialize the prior
+        self.prior_param = jnp.log(self.init_var) * jnp.ones(self.n_params_per_step)
+
+        self.params = [self.mean_params, self.sigma_params, self.prior_param]
+
+    def create_end2end_loss_fn(self, bypass_nn, diff_required):
+        supervised = self.supervised and diff_required
+        loss_method = self.loss_method
+        deterministic = self.deterministic
+
+        # resolve the algorithm once so that predict only traces the branch it needs
+        train_fn = self.train_fn if self.train_fn is not None else self.k_steps_train_fn
+        eval_fn = self.eval_fn if self.eval_fn is not None else self.k_steps_eval_fn
+
+        if bypass_nn:
+            ista_eval_fn = self.ista_eval_fn
+
+            def run_algo(iters, z0, q, params, z_star):
+                return ista_eval_fn(k=iters, z0=z0, q=q, z_star=z_star)
+        elif diff_required:
+            def run_algo(iters, z0, q, params, z_star):
+                return train_fn(k=iters,
+                                z0=z0,
+                                q=q,
+                                params=params,
+                                supervised=supervised,
+                                z_star=z_star)
+        else:
+            def run_algo(iters, z0, q, params, z_star):
+                return eval_fn(k=iters,
+                               z0=z0,
+                               q=q,
+                               params=params,
+                               supervised=supervised,
+                               z_star=z_star)
+
+        # params are deliberately not donated: predict runs nested inside the vmapped,
+        # jitted loss_fn (where donation is ignored) and the optimizer reuses params after
+        @partial(jit, static_argnames=('iters',))
+        def predict(params, input, q, iters, z_star, key, factor):
+            z0 = jnp.zeros(z_star.size)
+
+            # only sample the perturbation when the posterior is stochastic
+            if deterministic:
+                stochastic_params = params[0]
+            else:
+                std = jnp.exp(.5 * params[1])
+                stochastic_params = params[0] + \
+                    std * random.normal(key, (self.train_unrolls, self.n_params_per_step))
+
+            algo_out = run_algo(iters, z0, q, stochastic_params, z_star)
+            z_final, iter_losses = algo_out[0], algo_out[1]
+
+            loss = self.final_loss(loss_method, z_final,
+                                   iter_losses, supervised, z0, z_star)
+
+            penalty_loss = calculate_pinsker_penalty(
+                self.N_train, params, self.b, self.c, self.delta)
+            loss = loss + self.penalty_coeff * penalty_loss
+
+            if diff_required:
+                return loss
+            else:
+                z_all_plus_1, angles = algo_out[2], None
+                return_out = (loss, iter_losses, z_all_plus_1,
+                              angles) + algo_out[3:]
+                return return_out
+        loss_fn = self.predict_2_loss(predict, diff_required)
+        return loss_fn
+
+    def compute_all_params_KL(self, mean_params, sigma_params, lambd):
+        # one KL term per column (group) of the params, vectorized over the groups
+        batch_kl = vmap(compute_single_param_KL, in_axes=(1, 1, 0))
+        kl_per_group = batch_kl(mean_params, jnp.exp(sigma_params), jnp.exp(lambd))
+        return kl_per_group.sum()
+
+    def compute_weight_norm_squared(self, nn_params):
+        flat_params = nn_params.ravel()
+        return jnp.vdot(flat_params, flat_params), flat_params.size
+
+    def calculate_avg_posterior_var(self, params):
+        # sigma_params is a single (train_unrolls, n_params_per_step) array of log-variances
+        variances = jnp.exp(params[1])
+        return variances.mean(), variances.std()
@@ -32,7 +32,7 @@ class LISTAmodel(L2Omodel):
         self.m, self.n = D.shape
         self.output_size = self.n
 
-        evals, evecs = jnp.linalg.eigh(D.T @ D)
+        evals = jnp.linalg.eigvalsh(D.T @ D)
         L = evals.max()
         self.L = L
         # step = 1 / evals.max()
@@ -88,7 +88,7 @@ class LISTAmodel(L2Omodel):
                 eval_fn = self.k_steps_eval_fn
 
             # w_key = random.split(key)
-            w_key = random.PRNGKey(key)
+            w_key = key
             perturb1 = random.normal(w_key, (self.train_unrolls,))
             perturb2 = random.normal(
                 w_key, (self.n, self.m, self.train_unrolls))
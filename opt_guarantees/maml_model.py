@@ -64,7 +64,7 @@ class MAMLmodel(L2Omodel):
                 eval_fn = self.k_steps_eval_fn
 
             # w_key = random.split(key)
-            w_key = random.PRNGKey(key)
+            w_key = key
             perturb = random.normal(w_key, (self.train_unrolls, 2))
             # return scale * random.normal(w_key, (n, m))
             if self.deterministic:
@@ -72,7 +72,7 @@ class MAMLmodel(L2Omodel):
             else:
                 mean_params, sigma_params = params[0], params[1]
                 perturb = get_perturbed_weights(
-                    random.PRNGKey(key), self.layer_sizes, 1)
+                    key, self.layer_sizes, 1)
                 stochastic_params = [
                     (
                         perturb[i][0] *
@@ -32,7 +32,7 @@ class TILISTAmodel(L2Omodel):
         self.m, self.n = D.shape
         self.output_size = self.n
 
-        evals, evecs = jnp.linalg.eigh(D.T @ D)
+        evals = jnp.linalg.eigvalsh(D.T @ D)
         # step = 1 / evals.max()
         lambd = 0.1 
         self.ista_step = lambd / evals.max()
@@ -74,7 +74,7 @@ class TILISTAmodel(L2Omodel):
                 eval_fn = self.k_steps_eval_fn
 
             # w_key = random.split(key)
-            w_key = random.PRNGKey(key)
+            w_key = key
             perturb1 = random.normal(w_key, (self.train_unrolls, 2))
             perturb2 = random.normal(w_key, (self.m, self.n))
             # return scale * random.normal(w_key, (n, m))